@@ -27,7 +27,11 @@ def check_structure():
     
     missing_files = []
     for file in essential_files:
-        if not os.path.exists(file):
+        # EAFP: stat directly instead of exists()+later access, one syscall
+        # per file in the common (present) case
+        try:
+            os.stat(file)
+        except OSError:
             missing_files.append(file)
     
     if missing_files:
@@ -24,7 +24,10 @@ def setup_logging():
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
-            logging.FileHandler(os.path.join(log_dir, 'dqc_simulation.log')),
+            # delay=True: the log file is only opened on the first record,
+            # so importing/calling setup_logging repeatedly (e.g. from a
+            # notebook) doesn't hold an open file handle per call
+            logging.FileHandler(os.path.join(log_dir, 'dqc_simulation.log'), delay=True),
             logging.StreamHandler(),
         ],
     )
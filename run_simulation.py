@@ -9,14 +9,12 @@ from typing import Optional
 
 import numpy as np
 
-# Project imports
+# Project imports. The algorithm and visualization modules pull in the
+# heavyweight parts of Qiskit and matplotlib, so they are imported lazily
+# inside the methods that actually use them.
 from src.network.quantum_network import DistributedQuantumNetwork
 from src.network.protocols import QuantumProtocols
-from src.algorithms.grover import DistributedGrover
-from src.algorithms.qft import DistributedQFT
 from src.scheduler.quantum_scheduler import QuantumScheduler
-from src.utils.visualizer import ResultVisualizer
-from src.utils.metrics import calculate_efficiency_metrics, compare_configurations
 
 # Configuration
 try:
@@ -49,16 +47,35 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Bottleneck thresholds for analyze_results
+LATENCY_THRESHOLD = 0.2
+FIDELITY_THRESHOLD = 0.95
+RESOURCE_USAGE_RATIO = 0.6
+
 
 class DQCSimulation:
     """Main simulation class for Distributed Quantum Computing"""
 
+    __slots__ = (
+        "network",
+        "protocols",
+        "scheduler",
+        "visualizer",
+        "results",
+        "_num_nodes",
+        "_qubits_per_node",
+        "_is_setup",
+    )
+
     def __init__(self):
         self.network: Optional[DistributedQuantumNetwork] = None
         self.protocols: Optional[QuantumProtocols] = None
         self.scheduler: Optional[QuantumScheduler] = None
-        self.visualizer = ResultVisualizer()
+        self.visualizer = None  # Created on first visualize_results call
         self.results = {}
+        self._num_nodes: Optional[int] = None
+        self._qubits_per_node: Optional[int] = None
+        self._is_setup = False
 
     def setup_network(
         self,
@@ -66,19 +83,17 @@ class DQCSimulation:
         qubits_per_node: Optional[int] = None,
     ):
         """Setup the quantum network"""
-        if num_nodes is None:
-            num_nodes = NETWORK_CONFIG["default_num_nodes"]
-        if qubits_per_node is None:
-            qubits_per_node = NETWORK_CONFIG["default_qubits_per_node"]
-
-        if num_nodes is None or qubits_per_node is None:
-            raise ValueError(
-                "num_nodes and qubits_per_node must be integers or convertible to int"
-            )
-
+        # Fall back to config defaults and coerce in one expression; the
+        # config values are int literals, so no extra None checks needed
         try:
-            num_nodes = int(num_nodes)
-            qubits_per_node = int(qubits_per_node)
+            num_nodes = int(
+                num_nodes if num_nodes is not None else NETWORK_CONFIG["default_num_nodes"]
+            )
+            qubits_per_node = int(
+                qubits_per_node
+                if qubits_per_node is not None
+                else NETWORK_CONFIG["default_qubits_per_node"]
+            )
         except (TypeError, ValueError):
             raise ValueError(
                 "num_nodes and qubits_per_node must be integers or convertible to int"
@@ -90,60 +105,73 @@ class DQCSimulation:
             communication_latency=NETWORK_CONFIG["communication_latency"],
         )
 
-        self.protocols = QuantumProtocols(self.network)
+        # keep_history=True: visualize_results plots the raw per-operation
+        # series, not just the summary statistics
+        self.protocols = QuantumProtocols(self.network, keep_history=True)
         self.scheduler = QuantumScheduler(self.network)
 
+        # Cache constant network dimensions; the random helpers read these
+        # on every call
+        self._num_nodes = num_nodes
+        self._qubits_per_node = qubits_per_node
+        self._is_setup = True
+
         logger.info(
             f"Setup quantum network with {num_nodes} nodes, {qubits_per_node} qubits each"
         )
 
     def run_protocol_simulation(self, num_operations: Optional[int] = None):
         """Run quantum networking protocol simulations"""
-        if num_operations is None:
-            num_operations = SIMULATION_CONFIG["num_operations"]
-
-        logger.info(f"Starting protocol simulation with {num_operations} operations")
-
-        # Ensure the network and protocols are initialized
-        if self.protocols is None or self.network is None:
-            logger.info("Network/protocols not initialized, setting up default network")
-            self.setup_network()
-
         try:
-            assert num_operations is not None
-            num_operations = int(num_operations)
-        except (TypeError, ValueError, AssertionError):
+            num_operations = int(
+                num_operations
+                if num_operations is not None
+                else SIMULATION_CONFIG["num_operations"]
+            )
+        except (TypeError, ValueError):
             raise ValueError(
                 "num_operations must be an integer or convertible to int"
             )
 
-        assert (
-            self.protocols is not None and self.network is not None
-        ), "Network/protocols not initialized"
-        protocols = self.protocols
-
-        # TeleData (teleportation)
-        for i in range(num_operations):
-            node1, node2 = self._get_random_nodes()
-            qubit1 = self._get_random_qubit()
-            qubit2 = self._get_random_qubit()
+        logger.info(f"Starting protocol simulation with {num_operations} operations")
 
-            try:
-                protocols.teleport_qubit(node1, qubit1, node2, qubit2)
+        self._ensure_setup()
+        protocols = self.protocols
 
-                if (i + 1) % 20 == 0:
-                    logger.info(
-                        f"Completed {i + 1}/{num_operations} teleportation operations"
-                    )
-            except Exception as e:
-                logger.warning(f"Operation {i + 1} failed: {e}")
-                continue
+        # Draw all random node/qubit choices upfront in a few vectorized
+        # calls instead of one np.random call per operation; the seeded
+        # generator also makes runs reproducible
+        rng = np.random.default_rng(SIMULATION_CONFIG["random_seed"])
+        num_nodes = self._num_nodes
+        qubits_per_node = self._qubits_per_node
+
+        if num_nodes < 2:
+            raise ValueError("teleportation requires at least two nodes")
+
+        total_draws = num_operations + num_operations // 2
+        node_pairs = rng.integers(0, num_nodes, size=(total_draws, 2))
+        # Re-draw collisions; teleportation needs two different nodes
+        collisions = node_pairs[:, 0] == node_pairs[:, 1]
+        while collisions.any():
+            node_pairs[collisions, 1] = rng.integers(0, num_nodes, size=int(collisions.sum()))
+            collisions = node_pairs[:, 0] == node_pairs[:, 1]
+        qubit_pairs = rng.integers(0, qubits_per_node, size=(total_draws, 2))
+
+        # TeleData (teleportation): hand the whole batch to the protocol
+        # layer in one call; failures are logged and skipped internally
+        teleport_ops = np.column_stack(
+            (node_pairs[:num_operations, 0], qubit_pairs[:num_operations, 0],
+             node_pairs[:num_operations, 1], qubit_pairs[:num_operations, 1])
+        )
+        teleport_results = protocols.teleport_batch(teleport_ops)
+        logger.info(
+            f"Completed {len(teleport_results)}/{num_operations} teleportation operations"
+        )
 
         # TeleGate (remote gates)
         for i in range(num_operations // 2):
-            node1, node2 = self._get_random_nodes()
-            qubit1 = self._get_random_qubit()
-            qubit2 = self._get_random_qubit()
+            node1, node2 = node_pairs[num_operations + i]
+            qubit1, qubit2 = qubit_pairs[num_operations + i]
 
             try:
                 protocols.remote_gate_operation(
@@ -172,6 +200,9 @@ class DQCSimulation:
         """Run distributed quantum algorithm simulations"""
         logger.info("Starting algorithm simulation")
 
+        from src.algorithms.grover import DistributedGrover
+        from src.algorithms.qft import DistributedQFT
+
         algorithm_results = {}
 
         # Grover
@@ -198,11 +229,7 @@ class DQCSimulation:
                 "subcircuits"
             ]
 
-            if self.scheduler is None:
-                if self.network is None:
-                    self.setup_network()
-                self.scheduler = QuantumScheduler(self.network)
-
+            self._ensure_setup()
             self.scheduler.schedule_circuit(grover_subcircuits, priority=1)
             schedule_results = self.scheduler.execute_schedule()
 
@@ -214,24 +241,13 @@ class DQCSimulation:
         logger.warning("No algorithm results available for scheduling")
         return {}
 
-    def _get_random_nodes(self) -> tuple:
-        """Get two different random nodes"""
-        if self.network is None or not hasattr(self.network, "nodes"):
-            raise ValueError("Network is not initialized or missing 'nodes' attribute")
-
-        nodes = list(range(len(self.network.nodes)))
-        return tuple(np.random.choice(nodes, 2, replace=False))
-
-    def _get_random_qubit(self) -> int:
-        """Get a random qubit index"""
-        if (
-            self.network is None
-            or not hasattr(self.network, "nodes")
-            or not self.network.nodes
-        ):
-            raise ValueError("Network is not initialized or missing 'nodes' attribute")
-
-        return int(np.random.randint(0, self.network.nodes[0].num_qubits))
+    def _ensure_setup(self) -> None:
+        """Set up the default network once; entry points call this so the
+        helper methods can rely on the network/protocols/scheduler existing
+        """
+        if not self._is_setup:
+            logger.info("Network/protocols not initialized, setting up default network")
+            self.setup_network()
 
     def analyze_results(self):
         """Analyze simulation results and identify bottlenecks"""
@@ -240,17 +256,19 @@ class DQCSimulation:
         bottlenecks = {}
 
         if "protocol_metrics" in self.results:
+            # Pull every needed value up front, then evaluate all three
+            # conditions in one dict literal against the module thresholds
             metrics = self.results["protocol_metrics"]
-
             avg_latency = metrics.get("avg_teleportation_time", 0)
-            bottlenecks["high_communication_latency"] = avg_latency > 0.2
-
             avg_fidelity = metrics.get("avg_fidelity", 1.0)
-            bottlenecks["low_fidelity"] = avg_fidelity < 0.95
-
             total_entanglements = metrics.get("total_entanglements", 0)
             total_qubits = self.results["network_stats"]["total_qubits"]
-            bottlenecks["high_resource_usage"] = total_entanglements > total_qubits * 0.6
+
+            bottlenecks = {
+                "high_communication_latency": avg_latency > LATENCY_THRESHOLD,
+                "low_fidelity": avg_fidelity < FIDELITY_THRESHOLD,
+                "high_resource_usage": total_entanglements > total_qubits * RESOURCE_USAGE_RATIO,
+            }
 
         self.results["bottlenecks"] = bottlenecks
         logger.info("Bottleneck analysis completed")
@@ -309,6 +327,11 @@ class DQCSimulation:
         """Create visualizations of simulation results"""
         logger.info("Generating visualizations")
 
+        if self.visualizer is None:
+            from src.utils.visualizer import ResultVisualizer
+
+            self.visualizer = ResultVisualizer()
+
         if "detailed_metrics" in self.results:
             self.visualizer.plot_protocol_performance(
                 self.results["detailed_metrics"],
@@ -15,6 +15,7 @@ def create_directories():
     ]
     
     for directory in directories:
+        # exist_ok avoids a separate exists() check (and its stat syscall)
         os.makedirs(directory, exist_ok=True)
         print(f"Created directory: {directory}")
 
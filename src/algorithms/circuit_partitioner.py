@@ -1,56 +1,160 @@
 from qiskit import QuantumCircuit
+import collections
+import functools
+import numpy as np
 from typing import List, Tuple, Dict
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _compute_partitions(num_qubits: int, num_partitions: int) -> List[Tuple]:
+    """Split qubit indices into contiguous partition ranges"""
+    partitions = []
+    qubits_per_partition = num_qubits // num_partitions
+
+    for i in range(num_partitions):
+        start_qubit = i * qubits_per_partition
+        if i == num_partitions - 1:
+            end_qubit = num_qubits  # Last partition gets remaining qubits
+        else:
+            end_qubit = start_qubit + qubits_per_partition
+        partitions.append((start_qubit, end_qubit))
+
+    return partitions
+
+
+def _count_cross_gates(gate_qubits: Tuple[Tuple[int, ...], ...], partitions: List[Tuple],
+                       num_qubits: int) -> int:
+    """Count gates whose qubit indices span more than one partition"""
+    cross_gates = 0
+
+    qubit_to_partition = np.empty(num_qubits, dtype=np.int16)
+    for i, (start, end) in enumerate(partitions):
+        qubit_to_partition[start:end] = i
+
+    for indices in gate_qubits:
+        parts = qubit_to_partition[list(indices)]
+        if parts.size and parts.min() != parts.max():
+            cross_gates += 1
+
+    return cross_gates
+
+
+@functools.lru_cache(maxsize=128)
+def _partition_cached(fingerprint: Tuple, num_qubits: int, size: int, depth: int,
+                      num_partitions: int) -> Tuple[Tuple[Tuple, ...], Tuple]:
+    """Compute partitions and analysis from a circuit fingerprint.
+
+    The fingerprint carries every gate's name and qubit indices, so the
+    cross-partition estimate can be computed without the circuit object.
+    Results for identical circuits are served from the cache.
+    """
+    partitions = _compute_partitions(num_qubits, num_partitions)
+
+    gate_qubits = tuple(indices for _, indices in fingerprint)
+    cross_partition_gates = _count_cross_gates(gate_qubits, partitions, num_qubits)
+
+    analysis = {
+        'original_qubits': num_qubits,
+        'original_depth': depth,
+        # Stored as a tuple: the cached entry is shared across callers,
+        # and a list here would alias every returned analysis dict
+        'partition_qubits': tuple(end - start for start, end in partitions),
+        'num_partitions': num_partitions,
+        'communication_qubits': num_partitions - 1,
+        'estimated_cross_gates': cross_partition_gates,
+        'parallelism_potential': num_partitions,
+        'communication_overhead_ratio': cross_partition_gates / max(1, size)
+    }
+
+    return tuple(partitions), tuple(analysis.items())
+
 class CircuitPartitioner:
     """Handles partitioning of quantum circuits for distributed execution"""
-    
+
+    __slots__ = ('strategy', 'partitioning_history', '_circuit_meta')
+
     def __init__(self, strategy: str = 'vertical'):
         self.strategy = strategy
-        self.partitioning_history = []
-    
+        # Bounded: long-lived processes partition many circuits, and an
+        # unbounded list would grow forever
+        self.partitioning_history = collections.deque(maxlen=32)
+        # size/depth per circuit fingerprint; depth() walks the full DAG,
+        # so avoid recomputing it when identical circuits are analyzed
+        # repeatedly. Keyed on the fingerprint (not id(circuit), which can
+        # be reused after a circuit is freed) and bounded like the
+        # partition cache so it cannot grow without limit
+        self._circuit_meta = collections.OrderedDict()
+
+    @staticmethod
+    def _fingerprint(circuit: QuantumCircuit, bit_index: Dict) -> Tuple:
+        """Hashable (gate name, qubit indices) sequence for a circuit"""
+        return tuple(
+            (instruction.operation.name,
+             tuple(bit_index[qubit] for qubit in instruction.qubits))
+            for instruction in circuit.data
+        )
+
+    def _circuit_metadata(self, circuit: QuantumCircuit, fingerprint: Tuple) -> Tuple[int, int]:
+        """Return (size, depth) for a circuit, computed once per fingerprint"""
+        meta = self._circuit_meta.get(fingerprint)
+        if meta is None:
+            meta = (circuit.size(), circuit.depth())
+            if len(self._circuit_meta) >= 128:
+                self._circuit_meta.popitem(last=False)
+            self._circuit_meta[fingerprint] = meta
+        return meta
+
     def partition_circuit(self, circuit: QuantumCircuit, num_partitions: int) -> Tuple[List[Tuple], Dict]:
         """Partition a quantum circuit into multiple subcircuits"""
         num_qubits = circuit.num_qubits
-        
+
         if num_partitions > num_qubits:
             raise ValueError("Cannot have more partitions than qubits")
-        
-        partitions = []
-        qubits_per_partition = num_qubits // num_partitions
-        
-        for i in range(num_partitions):
-            start_qubit = i * qubits_per_partition
-            if i == num_partitions - 1:
-                end_qubit = num_qubits  # Last partition gets remaining qubits
-            else:
-                end_qubit = start_qubit + qubits_per_partition
-            partitions.append((start_qubit, end_qubit))
-        
-        # Analyze partitioning impact
-        analysis = self._analyze_partitioning(circuit, partitions)
-        
+
+        # Fingerprint the circuit so repeated calls on identical circuits
+        # hit the cache instead of re-walking every instruction
+        bit_index = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+        fingerprint = self._fingerprint(circuit, bit_index)
+
+        size, depth = self._circuit_metadata(circuit, fingerprint)
+        cached_partitions, cached_analysis = _partition_cached(
+            fingerprint, num_qubits, size, depth, num_partitions
+        )
+
+        partitions = list(cached_partitions)
+        analysis = dict(cached_analysis)
+        # Fresh list per caller, like partitions above; the cached value
+        # is an immutable tuple
+        analysis['partition_qubits'] = list(analysis['partition_qubits'])
+
+        # Record a lightweight summary only; keeping the circuit itself
+        # would pin every partitioned circuit in memory
         self.partitioning_history.append({
-            'circuit': circuit,
+            'num_qubits': num_qubits,
             'partitions': partitions,
             'analysis': analysis
         })
-        
+
         logger.info(f"Partitioned {num_qubits}-qubit circuit into {num_partitions} partitions")
-        
+
         return partitions, analysis
     
     def _analyze_partitioning(self, circuit: QuantumCircuit, partitions: List[Tuple]) -> Dict:
         """Analyze the impact of partitioning on circuit execution"""
         original_qubits = circuit.num_qubits
-        original_depth = circuit.depth()
-        
+
+        # Resolve qubit objects to indices once and share the map with the
+        # cross-gate estimate; avoids per-qubit find_bit lookups
+        bit_index = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+        fingerprint = self._fingerprint(circuit, bit_index)
+        circuit_size, original_depth = self._circuit_metadata(circuit, fingerprint)
+
         # Estimate communication overhead
         communication_qubits = len(partitions) - 1
-        cross_partition_gates = self._estimate_cross_partition_gates(circuit, partitions)
-        
+        cross_partition_gates = self._estimate_cross_partition_gates(circuit, partitions, bit_index)
+
         analysis = {
             'original_qubits': original_qubits,
             'original_depth': original_depth,
@@ -59,27 +163,30 @@ class CircuitPartitioner:
             'communication_qubits': communication_qubits,
             'estimated_cross_gates': cross_partition_gates,
             'parallelism_potential': len(partitions),
-            'communication_overhead_ratio': cross_partition_gates / max(1, circuit.size())
+            'communication_overhead_ratio': cross_partition_gates / max(1, circuit_size)
         }
-        
+
         return analysis
     
-    def _estimate_cross_partition_gates(self, circuit: QuantumCircuit, partitions: List[Tuple]) -> int:
+    def _estimate_cross_partition_gates(self, circuit: QuantumCircuit, partitions: List[Tuple],
+                                        bit_index: Dict = None) -> int:
         """Estimate number of gates that cross partition boundaries"""
         cross_gates = 0
-        
+
+        # Map each qubit index to its partition id once, instead of scanning
+        # every partition range for every qubit of every gate
+        qubit_to_partition = np.empty(circuit.num_qubits, dtype=np.int16)
+        for i, (start, end) in enumerate(partitions):
+            qubit_to_partition[start:end] = i
+
+        if bit_index is None:
+            bit_index = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+
         for instruction in circuit.data:
-            qubit_indices = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
-            
-            # Check if gate operates on qubits from different partitions
-            gate_partitions = set()
-            for qubit_idx in qubit_indices:
-                for i, (start, end) in enumerate(partitions):
-                    if start <= qubit_idx < end:
-                        gate_partitions.add(i)
-                        break
-            
-            if len(gate_partitions) > 1:
+            parts = qubit_to_partition[[bit_index[qubit] for qubit in instruction.qubits]]
+
+            # A gate crosses partitions iff its qubits span more than one id
+            if parts.size and parts.min() != parts.max():
                 cross_gates += 1
-        
+
         return cross_gates
\ No newline at end of file
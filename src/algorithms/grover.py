@@ -1,74 +1,137 @@
 from qiskit import QuantumCircuit
+import functools
 import numpy as np
 from typing import List, Dict
 from .circuit_partitioner import CircuitPartitioner
 
+
+def _zero_bits(num_qubits: int, marked_state: int) -> frozenset:
+    """Qubit indices whose bit is 0 in the marked state's binary form
+
+    Pure integer bit tests; avoids formatting the state into a binary
+    string and comparing it character by character. Qubit i maps to bit
+    (num_qubits - 1 - i), matching the MSB-first string convention.
+    """
+    mask = ~marked_state & ((1 << num_qubits) - 1)
+    return frozenset(num_qubits - 1 - j for j in range(num_qubits) if (mask >> j) & 1)
+
+
+def _apply_oracles(circuit: QuantumCircuit, num_qubits: int, patterns: List[frozenset]):
+    """Apply phase oracles for a sequence of zero-bit patterns
+
+    Consecutive oracles share their X-flip layer: only bits that differ
+    between adjacent patterns are toggled, since back-to-back X gates on
+    the same qubit cancel. Each X layer is emitted as one broadcast call.
+    """
+    flipped = frozenset()
+    for pattern in patterns:
+        toggle = sorted(flipped ^ pattern)
+        if toggle:
+            circuit.x(toggle)
+        flipped = pattern
+
+        # Multi-controlled Z gate
+        if num_qubits > 1:
+            circuit.h(num_qubits - 1)
+            circuit.mcx(list(range(num_qubits - 1)), num_qubits - 1)
+            circuit.h(num_qubits - 1)
+        else:
+            circuit.z(0)
+
+    # Uncompute whatever flips remain from the last pattern
+    if flipped:
+        circuit.x(sorted(flipped))
+
+
+@functools.lru_cache(maxsize=32)
+def _diffusion_circuit(num_qubits: int) -> QuantumCircuit:
+    """Grover diffusion operator, built once per qubit count
+
+    Composing this prebuilt block costs one call per iteration instead of
+    seven separate gate appends.
+    """
+    diffusion = QuantumCircuit(num_qubits)
+    diffusion.h(range(num_qubits))
+    diffusion.x(range(num_qubits))
+    diffusion.h(num_qubits - 1)
+    if num_qubits > 1:
+        diffusion.mcx(list(range(num_qubits - 1)), num_qubits - 1)
+    diffusion.h(num_qubits - 1)
+    diffusion.x(range(num_qubits))
+    diffusion.h(range(num_qubits))
+    return diffusion
+
+
+@functools.lru_cache(maxsize=32)
+def _build_grover_circuit(num_qubits: int, marked_states: tuple, iterations: int) -> QuantumCircuit:
+    """Build a Grover circuit; cached per (num_qubits, states, iterations)
+
+    Callers must copy the returned circuit before mutating it.
+    """
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+
+    # Initialize superposition
+    circuit.h(range(num_qubits))
+
+    # Compute each state's zero-bit pattern once; sorting/deduping lets
+    # consecutive oracles share X flips
+    patterns = [_zero_bits(num_qubits, state) for state in marked_states]
+
+    # Build one Grover step (all oracles + diffusion) and compose it per
+    # iteration; gate construction cost no longer scales with iterations
+    step = QuantumCircuit(num_qubits)
+    _apply_oracles(step, num_qubits, patterns)
+    step.compose(_diffusion_circuit(num_qubits), inplace=True)
+
+    # Grover iterations
+    for _ in range(iterations):
+        circuit.compose(step, inplace=True)
+
+    circuit.measure(range(num_qubits), range(num_qubits))
+
+    return circuit
+
+
 class DistributedGrover:
     """Distributed implementation of Grover's search algorithm"""
-    
+
+    __slots__ = ('num_qubits', 'partitioner')
+
     def __init__(self, num_qubits: int):
         self.num_qubits = num_qubits
         self.partitioner = CircuitPartitioner()
-    
+
     def create_circuit(self, marked_states: List[int], iterations: int = 1) -> QuantumCircuit:
         """Create Grover's search circuit"""
-        circuit = QuantumCircuit(self.num_qubits, self.num_qubits)
-        
-        # Initialize superposition
-        circuit.h(range(self.num_qubits))
-        
-        # Grover iterations
-        for _ in range(iterations):
-            # Oracle for marked states (simplified)
-            for state in marked_states:
-                self._add_oracle(circuit, state)
-            
-            # Diffusion operator
-            circuit.h(range(self.num_qubits))
-            circuit.x(range(self.num_qubits))
-            circuit.h(self.num_qubits - 1)
-            if self.num_qubits > 1:
-                circuit.mcx(list(range(self.num_qubits - 1)), self.num_qubits - 1)
-            circuit.h(self.num_qubits - 1)
-            circuit.x(range(self.num_qubits))
-            circuit.h(range(self.num_qubits))
-        
-        circuit.measure(range(self.num_qubits), range(self.num_qubits))
-        
-        return circuit
-    
+        # The cached builder returns a shared instance; hand out a copy so
+        # downstream mutation cannot corrupt the cache. Sorting is safe
+        # (the phase oracles commute) but duplicates must be kept: each
+        # list entry applies its oracle once, so a repeated state cancels
+        # its own phase flip
+        cached = _build_grover_circuit(
+            self.num_qubits, tuple(sorted(marked_states)), iterations
+        )
+        return cached.copy()
+
     def _add_oracle(self, circuit: QuantumCircuit, marked_state: int):
         """Add oracle for a specific marked state (simplified)"""
-        # Convert marked state to binary representation
-        binary_rep = format(marked_state, f'0{self.num_qubits}b')
-        
-        # Flip phases for marked state (simplified implementation)
-        for i, bit in enumerate(binary_rep):
-            if bit == '0':
-                circuit.x(i)
-        
-        # Multi-controlled Z gate
-        if self.num_qubits > 1:
-            circuit.h(self.num_qubits - 1)
-            circuit.mcx(list(range(self.num_qubits - 1)), self.num_qubits - 1)
-            circuit.h(self.num_qubits - 1)
-        else:
-            circuit.z(0)
-        
-        # Uncompute
-        for i, bit in enumerate(binary_rep):
-            if bit == '0':
-                circuit.x(i)
-    
-    def prepare_distributed_execution(self, num_partitions: int) -> Dict:
-        """Prepare Grover's circuit for distributed execution"""
+        _apply_oracles(circuit, self.num_qubits, [_zero_bits(self.num_qubits, marked_state)])
+
+    def prepare_distributed_execution(self, num_partitions: int, keep_circuit: bool = False) -> Dict:
+        """Prepare Grover's circuit for distributed execution
+
+        The full circuit is only included in the result when keep_circuit
+        is True; downstream consumers (scheduler, metrics) read only the
+        subcircuits, and retaining the circuit keeps every gate alive for
+        the lifetime of the results dict.
+        """
         # Create circuit
-        marked_states = [2**self.num_qubits - 1]  # Mark last state for simplicity
+        marked_states = [(1 << self.num_qubits) - 1]  # Mark last state for simplicity
         circuit = self.create_circuit(marked_states)
-        
+
         # Partition circuit
         partitions, analysis = self.partitioner.partition_circuit(circuit, num_partitions)
-        
+
         # Create subcircuits
         subcircuits = []
         for i, (start, end) in enumerate(partitions):
@@ -82,10 +145,12 @@ class DistributedGrover:
                 'start_qubit': start,
                 'end_qubit': end
             })
-        
-        return {
-            'original_circuit': circuit,
+
+        result = {
             'subcircuits': subcircuits,
             'partitions': partitions,
             'analysis': analysis
-        }
\ No newline at end of file
+        }
+        if keep_circuit:
+            result['original_circuit'] = circuit
+        return result
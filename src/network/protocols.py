@@ -1,3 +1,4 @@
+import math
 import numpy as np
 import time
 from typing import Dict, List, Tuple
@@ -6,17 +7,97 @@ from .quantum_network import DistributedQuantumNetwork
 
 logger = logging.getLogger(__name__)
 
+# Random numbers are generated in blocks of this size and consumed one at
+# a time; one vectorized draw amortizes RNG call overhead across the block
+_RNG_BATCH = 4096
+
+
+class _RunningStats:
+    """Welford online accumulator: O(1) mean/std/min/max per sample
+
+    Replaces rescanning the full metric lists on every
+    get_protocol_metrics call, which grew quadratic under periodic
+    polling.
+    """
+
+    __slots__ = ('n', 'mean', 'M2', 'min', 'max')
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value: float):
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.M2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def std(self) -> float:
+        # Population std, matching the previous np.std over the raw list
+        return math.sqrt(self.M2 / self.n) if self.n else 0.0
+
+
 class QuantumProtocols:
     """Implements quantum networking protocols (TeleData and TeleGate)"""
-    
-    def __init__(self, network: DistributedQuantumNetwork):
+
+    def __init__(self, network: DistributedQuantumNetwork, keep_history: bool = False):
         self.network = network
+        self.keep_history = keep_history
+        # Raw per-operation lists are only populated with
+        # keep_history=True (e.g. for plotting); summary statistics come
+        # from the running accumulators either way
         self.protocol_metrics = {
             'teleportation_times': [],
             'fidelities': [],
             'entanglement_consumption': [],
             'protocol_errors': []
         }
+        self._time_stats = _RunningStats()
+        self._fidelity_stats = _RunningStats()
+        self._entanglement_peak = 0
+        # Batched RNG buffers; indices start exhausted to force a fill
+        self._rng = np.random.default_rng()
+        self._teleport_rand_idx = _RNG_BATCH
+        self._gate_noise_idx = _RNG_BATCH
+
+    def _draw_teleport_randoms(self) -> Tuple[int, int, float]:
+        """Next (measurement0, measurement1, fidelity noise) from the batch"""
+        i = self._teleport_rand_idx
+        if i >= _RNG_BATCH:
+            self._measure_buf = self._rng.integers(0, 2, size=(_RNG_BATCH, 2), dtype=np.uint8)
+            self._noise_buf = self._rng.normal(0, 0.005, _RNG_BATCH)
+            i = 0
+        self._teleport_rand_idx = i + 1
+        return int(self._measure_buf[i, 0]), int(self._measure_buf[i, 1]), float(self._noise_buf[i])
+
+    def _draw_gate_noise(self) -> float:
+        """Next remote-gate fidelity noise sample from the batch"""
+        i = self._gate_noise_idx
+        if i >= _RNG_BATCH:
+            self._gate_noise_buf = self._rng.normal(0, 0.02, _RNG_BATCH)
+            i = 0
+        self._gate_noise_idx = i + 1
+        return float(self._gate_noise_buf[i])
+
+    def _record_operation(self, total_time: float, fidelity: float, entanglements: int = None):
+        """Update running statistics (and raw history when enabled)"""
+        self._time_stats.update(total_time)
+        self._fidelity_stats.update(fidelity)
+        if entanglements is not None and entanglements > self._entanglement_peak:
+            self._entanglement_peak = entanglements
+
+        if self.keep_history:
+            self.protocol_metrics['teleportation_times'].append(total_time)
+            self.protocol_metrics['fidelities'].append(fidelity)
+            if entanglements is not None:
+                self.protocol_metrics['entanglement_consumption'].append(entanglements)
     
     def teleport_qubit(self, source_node: int, source_qubit: int, 
                       target_node: int, target_qubit: int) -> Tuple[float, float]:
@@ -25,7 +106,8 @@ class QuantumProtocols:
         """
         start_time = self.network.global_time
         
-        logger.info(f"Starting teleportation: Node{source_node}.Q{source_qubit} -> Node{target_node}.Q{target_qubit}")
+        logger.info("Starting teleportation: Node%d.Q%d -> Node%d.Q%d",
+                    source_node, source_qubit, target_node, target_qubit)
         
         try:
             # Step 1: Create entanglement between source and target
@@ -35,7 +117,8 @@ class QuantumProtocols:
             # Step 2: Bell measurement at source (simulated)
             measure_time = 0.05
             self.network.global_time += measure_time
-            measurement_results = (np.random.randint(2), np.random.randint(2))
+            measure0, measure1, noise = self._draw_teleport_randoms()
+            measurement_results = (measure0, measure1)
             
             # Step 3: Classical communication of measurement results
             comm_time = self.network.communication_latency
@@ -54,16 +137,14 @@ class QuantumProtocols:
             
             # IMPROVED FIDELITY CALCULATION - More realistic
             base_fidelity = 0.96
-            # Much smaller, more realistic noise
-            noise = np.random.normal(0, 0.005)  
+            # Much smaller, more realistic noise (drawn with the
+            # measurement bits above, from the same batch)
             fidelity = max(0.94, min(0.98, base_fidelity + noise))
             
             # Record metrics
-            self.protocol_metrics['teleportation_times'].append(total_time)
-            self.protocol_metrics['fidelities'].append(fidelity)
-            self.protocol_metrics['entanglement_consumption'].append(len(self.network.entanglement_pairs))
+            self._record_operation(total_time, fidelity, len(self.network.entanglement_pairs))
             
-            logger.info(f"Teleportation completed: Time={total_time:.3f}s, Fidelity={fidelity:.3f}")
+            logger.info("Teleportation completed: Time=%.3fs, Fidelity=%.3f", total_time, fidelity)
             
             return total_time, fidelity
             
@@ -73,6 +154,25 @@ class QuantumProtocols:
             self.protocol_metrics['protocol_errors'].append(error_msg)
             raise
     
+    def teleport_batch(self, operations) -> List[Tuple[float, float]]:
+        """
+        Run a batch of teleportations from an (N, 4) array of
+        (source_node, source_qubit, target_node, target_qubit) rows
+
+        Failed operations are recorded in protocol_metrics and skipped, so
+        callers get one call site instead of a try/except per operation.
+        """
+        results = []
+        for source_node, source_qubit, target_node, target_qubit in np.asarray(operations):
+            try:
+                results.append(self.teleport_qubit(int(source_node), int(source_qubit),
+                                                   int(target_node), int(target_qubit)))
+            except Exception as e:
+                logger.warning("Batched teleportation failed: %s", e)
+                continue
+
+        return results
+
     def remote_gate_operation(self, control_node: int, control_qubit: int,
                             target_node: int, target_qubit: int, gate_type: str = 'CNOT') -> Tuple[float, float]:
         """
@@ -83,7 +183,8 @@ class QuantumProtocols:
         """
         start_time = self.network.global_time
         
-        logger.info(f"Starting remote {gate_type} gate: Node{control_node}.Q{control_qubit} -> Node{target_node}.Q{target_qubit}")
+        logger.info("Starting remote %s gate: Node%d.Q%d -> Node%d.Q%d",
+                    gate_type, control_node, control_qubit, target_node, target_qubit)
         
         try:
             # For CNOT-like operations, we need entanglement and classical communication
@@ -101,7 +202,7 @@ class QuantumProtocols:
                 self.network.global_time += comm_time
                 
                 total_time = self.network.global_time - start_time
-                fidelity = 0.94 + np.random.normal(0, 0.02)  # Slightly lower fidelity for gates
+                fidelity = 0.94 + self._draw_gate_noise()  # Slightly lower fidelity for gates
                 fidelity = max(0.8, min(1.0, fidelity))
                 
             else:
@@ -110,10 +211,9 @@ class QuantumProtocols:
                 total_time = gate_time
                 fidelity = 0.98  # High fidelity for local gates
             
-            self.protocol_metrics['teleportation_times'].append(total_time)
-            self.protocol_metrics['fidelities'].append(fidelity)
-            
-            logger.info(f"Remote gate completed: Time={total_time:.3f}s, Fidelity={fidelity:.3f}")
+            self._record_operation(total_time, fidelity)
+
+            logger.info("Remote gate completed: Time=%.3fs, Fidelity=%.3f", total_time, fidelity)
             
             return total_time, fidelity
             
@@ -125,16 +225,17 @@ class QuantumProtocols:
     
     def get_protocol_metrics(self) -> Dict:
         """Get comprehensive protocol performance metrics"""
-        if not self.protocol_metrics['teleportation_times']:
+        if self._time_stats.n == 0:
             return {}
-        
+
+        # O(1) reads from the running accumulators; no list rescans
         return {
-            'avg_teleportation_time': np.mean(self.protocol_metrics['teleportation_times']),
-            'std_teleportation_time': np.std(self.protocol_metrics['teleportation_times']),
-            'avg_fidelity': np.mean(self.protocol_metrics['fidelities']),
-            'min_fidelity': np.min(self.protocol_metrics['fidelities']),
-            'max_fidelity': np.max(self.protocol_metrics['fidelities']),
-            'total_operations': len(self.protocol_metrics['teleportation_times']),
-            'total_entanglements': max(self.protocol_metrics['entanglement_consumption']) if self.protocol_metrics['entanglement_consumption'] else 0,
+            'avg_teleportation_time': self._time_stats.mean,
+            'std_teleportation_time': self._time_stats.std(),
+            'avg_fidelity': self._fidelity_stats.mean,
+            'min_fidelity': self._fidelity_stats.min,
+            'max_fidelity': self._fidelity_stats.max,
+            'total_operations': self._time_stats.n,
+            'total_entanglements': self._entanglement_peak,
             'error_count': len(self.protocol_metrics['protocol_errors'])
         }
\ No newline at end of file
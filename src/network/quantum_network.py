@@ -1,5 +1,7 @@
+import heapq
 import numpy as np
 import time
+from collections import deque
 from typing import List, Dict, Tuple, Optional
 import logging
 
@@ -8,70 +10,182 @@ logger = logging.getLogger(__name__)
 class QuantumNetworkNode:
     """Represents a single QPU in the distributed quantum network"""
     
-    def __init__(self, node_id: int, num_qubits: int):
+    def __init__(self, node_id: int, num_qubits: int, realtime: bool = False):
         self.node_id = node_id
         self.num_qubits = num_qubits
-        self.qubits = [{
-            'state': None,
-            'entangled_with': (None, None),
-            'last_operation': None
-        } for _ in range(num_qubits)]
-        self.available_qubits = set(range(num_qubits))
+        self.realtime = realtime
+        # Structure-of-arrays qubit record: three parallel lists instead
+        # of one dict per qubit, which dominated memory on large networks
+        self.qubit_state = [None] * num_qubits
+        self.qubit_entangled = [(None, None)] * num_qubits
+        self.qubit_last_op = [None] * num_qubits
+        # FIFO pool: the scheduler only ever takes from the head and
+        # returns qubits, so a deque's O(1) popleft/append beats
+        # materializing the set into a list per reservation
+        self.available_qubits = deque(range(num_qubits))
         self.operation_history = []
         self.total_operations = 0
-        
-        logger.debug(f"Initialized Node {node_id} with {num_qubits} qubits")
-    
+        self.simulated_time = 0.0
+        self._op_seq = 0
+        self.first_op_time = None
+        # Set by the network so it can maintain stats incrementally
+        self._on_operation = None
+        self._network = None
+
+        logger.debug("Initialized Node %d with %d qubits", node_id, num_qubits)
+
     def execute_gate(self, gate_type: str, qubits: List[int], duration: float = 0.01) -> float:
         """Execute a quantum gate on specified qubits"""
         if not all(0 <= q < self.num_qubits for q in qubits):
             raise ValueError(f"Invalid qubit indices: {qubits}")
-        
-        # Simulate gate execution time
-        time.sleep(duration)
-        
+
+        # Gate duration is a simulation parameter, not a wall-clock
+        # requirement: account for it instead of sleeping. Opt into real
+        # pacing with realtime=True on the network constructor.
+        if self.realtime:
+            time.sleep(duration)
+        if self.first_op_time is None:
+            self.first_op_time = self._current_time()
+        self.simulated_time += duration
+        self._op_seq += 1
+
         operation_record = {
             'gate': gate_type,
             'qubits': qubits,
-            'timestamp': time.time(),
+            'timestamp': self._op_seq,
             'duration': duration,
             'node_id': self.node_id
         }
         
         self.operation_history.append(operation_record)
         self.total_operations += 1
-        
-        logger.debug(f"Node {self.node_id}: Executed {gate_type} on qubits {qubits}")
+        if self._on_operation is not None:
+            self._on_operation(self)
+
+        # %-style args defer formatting until the record is emitted; the
+        # isEnabledFor gate also skips the call itself on the gate path
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Node %d: Executed %s on qubits %s", self.node_id, gate_type, qubits)
         return duration
     
+    def _current_time(self) -> float:
+        """Network clock if attached, else this node's own gate time"""
+        if self._network is not None:
+            return self._network.current_time()
+        return self.simulated_time
+
     def get_utilization(self) -> float:
-        """Calculate node utilization based on operation history"""
-        if not self.operation_history:
+        """Fraction of elapsed network time spent executing gates
+
+        The old history-count ratio compared two counters that were
+        incremented together, so it was identically 1.0 for any node
+        that had ever run a gate. Busy time over wall time since the
+        first operation is an actual signal.
+        """
+        if self.first_op_time is None:
             return 0.0
-        return len(self.operation_history) / max(self.total_operations, 1)
+        wall = self._current_time() - self.first_op_time
+        return min(1.0, self.simulated_time / max(wall, 1e-9))
     
     def reset_qubit(self, qubit_idx: int):
         """Reset a qubit to its initial state"""
         if 0 <= qubit_idx < self.num_qubits:
-            self.qubits[qubit_idx] = {
-                'state': None,
-                'entangled_with': (None, None),
-                'last_operation': None
-            }
-            self.available_qubits.add(qubit_idx)
-            logger.debug(f"Node {self.node_id}: Reset qubit {qubit_idx}")
+            self.qubit_state[qubit_idx] = None
+            self.qubit_entangled[qubit_idx] = (None, None)
+            self.qubit_last_op[qubit_idx] = None
+            if qubit_idx not in self.available_qubits:
+                self.available_qubits.append(qubit_idx)
+            logger.debug("Node %d: Reset qubit %d", self.node_id, qubit_idx)
 
 class DistributedQuantumNetwork:
     """Manages the distributed quantum computing network"""
     
-    def __init__(self, num_nodes: int, qubits_per_node: int, communication_latency: float = 0.1):
-        self.nodes = [QuantumNetworkNode(i, qubits_per_node) for i in range(num_nodes)]
+    def __init__(self, num_nodes: int, qubits_per_node: int, communication_latency: float = 0.1,
+                 realtime: bool = False):
+        self.nodes = [QuantumNetworkNode(i, qubits_per_node, realtime=realtime) for i in range(num_nodes)]
+        self.realtime = realtime
         self.communication_latency = communication_latency
         self.entanglement_pairs = []
         self.communication_history = []
         self.global_time = 0.0
-        
+        # Max-heap over free-qubit counts, so capacity lookups are
+        # O(log N) instead of a linear node scan. Lazy deletion: each
+        # node's live entry is tracked in _heap_entries; superseded
+        # entries are flagged in place and dropped when they surface at
+        # the top, keeping the heap at O(nodes + pending updates)
+        self._free_heap = []
+        self._heap_entries = {}
+        self._stale_entries = 0
+        for node in self.nodes:
+            self._note_free_count(node.node_id, node.num_qubits)
+        # Incremental stats counters, updated from the per-node operation
+        # hook so get_network_stats never rescans operation histories
+        self._total_qubits = num_nodes * qubits_per_node
+        self._total_operations = 0
+        self._max_node_time = 0.0
+        self._node_utilizations = np.zeros(num_nodes)
+        for node in self.nodes:
+            node._on_operation = self._record_node_operation
+            node._network = self
+
         logger.info(f"Initialized quantum network with {num_nodes} nodes, {qubits_per_node} qubits each")
+
+    def _note_free_count(self, node_id: int, free: int):
+        """Record a node's free-qubit count in the capacity heap
+
+        The node's previous entry is flagged stale in place rather than
+        searched for and removed; find_node_with_capacity pops flagged
+        entries when they reach the top, and once the heap is mostly
+        stale it is rebuilt from the live entries. Re-noting an
+        unchanged count is a no-op, so round-trips (reserve then
+        release) do not pile up duplicate live entries.
+        """
+        old = self._heap_entries.get(node_id)
+        if old is not None:
+            if old[0] == -free:
+                return
+            old[2] = True
+            self._stale_entries += 1
+        entry = [-free, node_id, False]
+        self._heap_entries[node_id] = entry
+        heapq.heappush(self._free_heap, entry)
+        if self._stale_entries > len(self._heap_entries):
+            # Majority-stale heap: compact to the one live entry per
+            # node. O(N) but amortized O(1) per update
+            self._free_heap = list(self._heap_entries.values())
+            heapq.heapify(self._free_heap)
+            self._stale_entries = 0
+
+    def find_node_with_capacity(self, required_qubits: int) -> Optional[int]:
+        """Find the node with the most free qubits, if any has enough"""
+        while self._free_heap:
+            neg_count, node_id, flagged_stale = self._free_heap[0]
+            if flagged_stale:
+                heapq.heappop(self._free_heap)
+                self._stale_entries -= 1
+                continue
+            free = len(self.nodes[node_id].available_qubits)
+            if -neg_count != free:
+                # Pool changed outside reserve/release (e.g. a direct
+                # node allocation): drop the entry and note the live count
+                heapq.heappop(self._free_heap)
+                self._note_free_count(node_id, free)
+                continue
+            return node_id if free >= required_qubits else None
+        return None
+
+    def reserve_qubits(self, node_id: int, count: int) -> List[int]:
+        """Take qubits from a node's free pool, keeping the heap current"""
+        node = self.nodes[node_id]
+        qubits = [node.available_qubits.popleft() for _ in range(count)]
+        self._note_free_count(node_id, len(node.available_qubits))
+        return qubits
+
+    def release_qubits(self, node_id: int, qubits: List[int]):
+        """Return reserved qubits to a node's free pool"""
+        node = self.nodes[node_id]
+        node.available_qubits.extend(qubits)
+        self._note_free_count(node_id, len(node.available_qubits))
     
     def create_entanglement(self, node1: int, qubit1: int, node2: int, qubit2: int) -> float:
         """Create entanglement between two qubits on different nodes"""
@@ -94,20 +208,36 @@ class DistributedQuantumNetwork:
         self.entanglement_pairs.append(entanglement_pair)
         
         # Update qubit states
-        self.nodes[node1].qubits[qubit1]['entangled_with'] = (node2, qubit2)
-        self.nodes[node2].qubits[qubit2]['entangled_with'] = (node1, qubit1)
+        self.nodes[node1].qubit_entangled[qubit1] = (node2, qubit2)
+        self.nodes[node2].qubit_entangled[qubit2] = (node1, qubit1)
         
-        logger.info(f"Created entanglement: Node{node1}.Q{qubit1} <-> Node{node2}.Q{qubit2}")
+        logger.info("Created entanglement: Node%d.Q%d <-> Node%d.Q%d", node1, qubit1, node2, qubit2)
         return entanglement_time
     
+    def current_time(self) -> float:
+        """Network clock: communication time or gate time, whichever leads"""
+        return max(self.global_time, self._max_node_time)
+
+    def _record_node_operation(self, node: QuantumNetworkNode):
+        """Operation hook: keep the stats counters current in O(1)"""
+        self._total_operations += 1
+        if node.simulated_time > self._max_node_time:
+            self._max_node_time = node.simulated_time
+        self._node_utilizations[node.node_id] = node.get_utilization()
+
     def get_network_stats(self) -> Dict:
         """Get comprehensive network statistics"""
+        # All counters are maintained incrementally by the per-node
+        # operation hook; polling stats costs one array copy, not a
+        # rescan of every node's history. Per-node simulated gate time is
+        # folded into the global clock since gate execution no longer
+        # blocks wall time
         stats = {
             'total_nodes': len(self.nodes),
-            'total_qubits': sum(node.num_qubits for node in self.nodes),
+            'total_qubits': self._total_qubits,
             'active_entanglements': len(self.entanglement_pairs),
-            'total_operations': sum(node.total_operations for node in self.nodes),
-            'node_utilizations': [node.get_utilization() for node in self.nodes],
-            'global_time': self.global_time
+            'total_operations': self._total_operations,
+            'node_utilizations': self._node_utilizations.tolist(),
+            'global_time': max(self.global_time, self._max_node_time)
         }
         return stats
\ No newline at end of file
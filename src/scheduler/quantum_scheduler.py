@@ -17,24 +17,33 @@ class QuantumScheduler:
         
     def schedule_circuit(self, subcircuits: List[Dict], priority: int = 1):
         """Schedule subcircuits for execution"""
-        timestamp = time.time()
-        
-        for i, subcircuit in enumerate(subcircuits):
-            heapq.heappush(self.schedule_queue, 
-                         (priority, timestamp, i, subcircuit))
+        timestamp = time.monotonic()
+
+        if not self.schedule_queue:
+            # Batch insert into an empty queue: building the list and
+            # heapifying is O(K) versus O(K log K) individual pushes
+            self.schedule_queue = [(priority, timestamp, i, subcircuit)
+                                   for i, subcircuit in enumerate(subcircuits)]
+            heapq.heapify(self.schedule_queue)
+        else:
+            for i, subcircuit in enumerate(subcircuits):
+                heapq.heappush(self.schedule_queue,
+                             (priority, timestamp, i, subcircuit))
         
-        logger.info(f"Scheduled {len(subcircuits)} subcircuits with priority {priority}")
+        logger.info("Scheduled %d subcircuits with priority %d", len(subcircuits), priority)
     
     def execute_schedule(self) -> Dict:
         """Execute the scheduled circuits"""
         start_time = self.network.global_time
         execution_results = []
         
-        temp_queue = self.schedule_queue.copy()
-        self.schedule_queue = []  # Clear the queue
-        
-        while temp_queue:
-            priority, timestamp, circuit_id, subcircuit = heapq.heappop(temp_queue)
+        # Drain the live queue in place; rescheduled items go into the
+        # fresh list, so no O(n) snapshot copy is needed
+        pending = self.schedule_queue
+        self.schedule_queue = []
+
+        while pending:
+            priority, timestamp, circuit_id, subcircuit = heapq.heappop(pending)
             
             # Find available node with sufficient qubits
             target_node = self._find_available_node(subcircuit['required_qubits'])
@@ -44,7 +53,7 @@ class QuantumScheduler:
                 result = self._execute_on_node(target_node, subcircuit)
                 execution_results.append(result)
                 
-                logger.debug(f"Executed subcircuit {circuit_id} on node {target_node}")
+                logger.debug("Executed subcircuit %d on node %d", circuit_id, target_node)
             else:
                 # No available node, reschedule
                 heapq.heappush(self.schedule_queue, 
@@ -66,29 +75,25 @@ class QuantumScheduler:
     
     def _find_available_node(self, required_qubits: int) -> Optional[int]:
         """Find a node with sufficient available qubits"""
-        for node in self.network.nodes:
-            if len(node.available_qubits) >= required_qubits:
-                return node.node_id
-        return None
+        # O(log N) heap lookup on the network instead of a node scan
+        return self.network.find_node_with_capacity(required_qubits)
     
     def _execute_on_node(self, node_id: int, subcircuit: Dict) -> Dict:
         """Execute subcircuit on specific node"""
         node = self.network.nodes[node_id]
         
-        # Mark qubits as used
-        used_qubits = list(node.available_qubits)[:subcircuit['required_qubits']]
-        for qubit in used_qubits:
-            node.available_qubits.remove(qubit)
-        
+        # Take qubits from the head of the node's FIFO pool via the
+        # network so its capacity heap stays current
+        used_qubits = self.network.reserve_qubits(node_id, subcircuit['required_qubits'])
+
         # Simulate circuit execution
         execution_time = 0.1  # Base execution time
         for i in range(subcircuit['required_qubits']):
             exec_time = node.execute_gate('H', [i], 0.01)
             execution_time += exec_time
-        
+
         # Free qubits
-        for qubit in used_qubits:
-            node.available_qubits.add(qubit)
+        self.network.release_qubits(node_id, used_qubits)
         
         return {
             'node_id': node_id,
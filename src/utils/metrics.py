@@ -75,17 +75,16 @@ def compare_configurations(config_results: Dict) -> Dict:
             'total_operations': protocol_metrics.get('total_operations', 0)
         }
     
-    # Rank configurations
-    ranked_configs = sorted(
-        comparison.items(),
-        key=lambda x: (
-            -x[1]['avg_fidelity'],  # Higher fidelity better
-            x[1]['avg_teleportation_time'],  # Lower time better
-            -x[1]['throughput']  # Higher throughput better
-        )
-    )
-    
-    comparison['ranking'] = [config[0] for config in ranked_configs]
-    comparison['best_config'] = ranked_configs[0][0] if ranked_configs else None
+    # Rank configurations with one lexsort over stacked metric arrays
+    # instead of per-item key tuples; np.lexsort treats its last key as
+    # primary, so the order below is throughput, time, fidelity
+    names = list(comparison.keys())
+    fidelities = np.fromiter((comparison[name]['avg_fidelity'] for name in names), float)
+    times = np.fromiter((comparison[name]['avg_teleportation_time'] for name in names), float)
+    throughputs = np.fromiter((comparison[name]['throughput'] for name in names), float)
+    order = np.lexsort((-throughputs, times, -fidelities))
+
+    comparison['ranking'] = [names[i] for i in order]
+    comparison['best_config'] = names[order[0]] if names else None
     
     return comparison
\ No newline at end of file